@@ -6,15 +6,18 @@ import pkgutil
 import sys
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from textwrap import dedent
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
-    Literal,
+    NamedTuple,
     Optional,
     Set,
+    Tuple,
     Type,
     get_args,
     get_origin,
@@ -22,12 +25,11 @@ from typing import (
 )
 
 from jinja2 import Environment, PackageLoader, Template  # type: ignore
-from typing_inspect import is_callable_type, is_literal_type  # type: ignore
+from typing_inspect import is_callable_type  # type: ignore
 
 import hydra
 from omegaconf import OmegaConf, ValidationError
 from omegaconf._utils import (
-    _resolve_optional,
     get_dict_key_value_types,
     get_list_element_type,
     is_dict_annotation,
@@ -41,7 +43,9 @@ from configen.config import Config, ConfigenConf, ModuleConf
 from configen.utils import (
     collect_imports,
     convert_imports,
+    is_literal_annotation,
     is_tuple_annotation,
+    resolve_optional,
     type_str,
 )
 
@@ -55,8 +59,38 @@ jinja_env = Environment(
     loader=PackageLoader("configen", "templates"),
     keep_trailing_newline=True,
     trim_blocks=True,
+    # The packaged templates never change while configen runs.
+    auto_reload=False,
+    cache_size=-1,
 )
 jinja_env.tests["empty"] = lambda x: x == inspect.Signature.empty
+_MODULE_TEMPLATE = jinja_env.get_template("module.j2")
+
+
+@lru_cache(maxsize=None)
+def _path_template(pattern: str) -> Template:
+    return Template(pattern)
+
+
+@lru_cache(maxsize=None)
+def _resolve_class(full_name: str) -> type:
+    return hydra.utils.get_class(full_name)
+
+
+@lru_cache(maxsize=None)
+def _hints(fn: Callable[..., Any]) -> Dict[str, Any]:
+    return get_type_hints(fn)
+
+
+@lru_cache(maxsize=None)
+def _init_params(cls: type) -> Tuple[Tuple[str, Any, Any], ...]:
+    sig = inspect.signature(cls.__init__)
+    return tuple(
+        (name, p.default, p.annotation)
+        for name, p in sig.parameters.items()
+        # Skip self/args as attributes
+        if name != "self" and p.kind not in (p.VAR_POSITIONAL, p.VAR_KEYWORD)
+    )
 
 
 def init_config(conf_dir: str) -> None:
@@ -74,19 +108,22 @@ def init_config(conf_dir: str) -> None:
     file.write_bytes(sample_config)
 
 
-def save(cfg: ConfigenConf, module: str, code: str) -> None:
+def module_file(cfg: ConfigenConf, module: str) -> Path:
     module_path = module.replace(".", "/")
 
-    module_path_pattern = Template(cfg.module_path_pattern).render(module_path=module_path)
+    module_path_pattern = _path_template(cfg.module_path_pattern).render(module_path=module_path)
     assert module_path_pattern
-    path = Path(cfg.output_dir) / module_path_pattern
+    return Path(cfg.output_dir) / module_path_pattern
+
+
+def save(cfg: ConfigenConf, module: str, code: str) -> None:
+    path = module_file(cfg, module)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(code)
     log.info(f"{module}.{module} -> {path}")
 
 
-@dataclass
-class Parameter:
+class Parameter(NamedTuple):
     name: str
     type_str: str
     default: Optional[str]
@@ -100,13 +137,18 @@ class ClassInfo:
     target: str
 
 
+_PRIMITIVE_TYPES = (int, float, str, bool)
+_COMPATIBLE_TYPES = frozenset({type(None), tuple, list, dict, Path, Any, *_PRIMITIVE_TYPES})
+
+
+@lru_cache(maxsize=4096)
 def is_incompatible(type_: Type[Any]) -> bool:
-    _, type_ = _resolve_optional(type_)
-    if type_ in (type(None), tuple, list, dict, Path):
+    _, type_ = resolve_optional(type_)
+    if type_ in _COMPATIBLE_TYPES or (isinstance(type_, type) and issubclass(type_, Enum)):
         return False
     try:
         # Literal values must be primitive so no need to run a compatibility-check over them.
-        if is_literal_type(type_) or get_origin(type_) is Literal:
+        if is_literal_annotation(type_):
             return False
         # Callable isn't a class so the subsequent issubclass check would raise
         # a rype-error if called on it
@@ -117,7 +159,7 @@ def is_incompatible(type_: Type[Any]) -> bool:
             return is_incompatible(lt)
         elif is_dict_annotation(type_):
             kvt = get_dict_key_value_types(type_)
-            if not issubclass(kvt[0], (str, Enum)):
+            if kvt[0] is not str and not issubclass(kvt[0], (str, Enum)):
                 return True
             return is_incompatible(kvt[1])
         elif is_tuple_annotation(type_):
@@ -128,11 +170,7 @@ def is_incompatible(type_: Type[Any]) -> bool:
             # 'compatible' here due to downstream conversion into primitive types (since Literal
             # types themselves are currently not supported).
             return any(
-                not (
-                    is_primitive_type_annotation(arg)
-                    or is_literal_type(arg)
-                    or get_origin(arg) is Literal
-                )
+                not (is_primitive_type_annotation(arg) or is_literal_annotation(arg))
                 for arg in args
             )
         origin = get_origin(type_)
@@ -142,7 +180,8 @@ def is_incompatible(type_: Type[Any]) -> bool:
     except ValidationError:
         return True
 
-    if type_ is Any or issubclass(type_, (int, float, str, bool, Enum)):
+    # Exact primitives, Any and Enums were accepted up front; only subclasses of primitives remain.
+    if issubclass(type_, _PRIMITIVE_TYPES):
         return False
     if is_structured_config(type_):
         try:
@@ -156,109 +195,130 @@ def is_incompatible(type_: Type[Any]) -> bool:
     return True
 
 
-def get_default_flags(module: ModuleConf) -> List[Parameter]:
+def get_default_flags(module: ModuleConf) -> Tuple[Parameter, ...]:
+    convert = module.default_flags._convert_
+    # ConvertMode overrides __eq__ without __hash__, so key the cache on its name.
+    return _default_flags(
+        None if convert is None else convert.name, module.default_flags._recursive_
+    )
+
+
+@lru_cache(maxsize=None)
+def _default_flags(convert: Optional[str], recursive: Optional[bool]) -> Tuple[Parameter, ...]:
     def_flags: List[Parameter] = []
 
-    if module.default_flags._convert_ is not None:
+    if convert is not None:
         def_flags.append(
             Parameter(
                 name="_convert_",
                 type_str="str",
-                default=f'"{module.default_flags._convert_.name}"',
+                default=f'"{convert}"',
             )
         )
 
-    if module.default_flags._recursive_ is not None:
+    if recursive is not None:
         def_flags.append(
             Parameter(
                 name="_recursive_",
                 type_str="bool",
-                default=str(module.default_flags._recursive_),
+                default=str(recursive),
             )
         )
 
-    return def_flags
+    return tuple(def_flags)
+
+
+@lru_cache(maxsize=256)
+def _default_factory(value_repr: str) -> str:
+    return f"field(default_factory=lambda: {value_repr})"
+
+
+def _build_parameter(
+    name: str,
+    default_: Any,
+    annotation: Any,
+    resolved_hints: Dict[str, Any],
+    imports: Set[Type],
+    string_imports: Set[str],
+) -> Parameter:
+    type_ = type_cached = resolved_hints.get(name, annotation)
+    default_type = type(default_)
+
+    missing_value = default_ is inspect.Parameter.empty
+    incompatible_value_type = not missing_value and is_incompatible(default_type)
+    missing_annotation_type = name not in resolved_hints
+    incompatible_annotation_type = not missing_annotation_type and is_incompatible(type_)
+
+    if isinstance(default_, Enum):
+        enum_module = getattr(default_, "__module__", None)
+        if enum_module is not None:  # Import required
+            string_imports.add(f"from {enum_module} import {default_type.__name__}")
+
+    if missing_annotation_type or incompatible_annotation_type:
+        type_ = Any
+        collect_imports(imports, Any)  # type: ignore
+
+    if not missing_value:
+        if type_ is str or default_type is str:
+            default_ = f'"{default_}"'
+        elif isinstance(default_, (list, dict)):
+            default_ = _default_factory(repr(default_))
+
+    missing_default = True if incompatible_value_type else missing_value
+    collect_imports(imports, type_)  # type: ignore
+
+    if missing_default:
+        default_ = "MISSING"
+        string_imports.add("from omegaconf import MISSING")
+
+    # Only Enum defaults that were left untouched above still need rendering.
+    if isinstance(default_, Enum):
+        default_ = Enum.__str__(default_)
+
+    if incompatible_annotation_type:
+        default_ = f"{default_}  # {type_str(type_cached)}"
+    elif incompatible_value_type:
+        default_ = f"{default_}  # {type_str(default_type)}"  # if not missing_value:
+
+    return Parameter(name=name, type_str=type_str(type_), default=str(default_))
+
+
+def _build_class_info(
+    module_name: str,
+    class_name: str,
+    default_flags: Tuple[Parameter, ...],
+    imports: Set[Type],
+    string_imports: Set[str],
+) -> ClassInfo:
+    full_name = f"{module_name}.{class_name}"
+    cls = _resolve_class(full_name)
+    resolved_hints = _hints(cls.__init__)
+    params: List[Parameter] = [*default_flags]
+    params.extend(
+        _build_parameter(name, default_, annotation, resolved_hints, imports, string_imports)
+        for name, default_, annotation in _init_params(cls)
+    )
+    return ClassInfo(
+        target=full_name,
+        module=module_name,
+        name=class_name,
+        parameters=params,
+    )
 
 
 def generate_module(cfg: ConfigenConf, module: ModuleConf) -> str:
     classes_map: Dict[str, ClassInfo] = {}
-    imports = set()
+    imports: Set[Type] = set()
     string_imports: Set[str] = set()
 
     default_flags = get_default_flags(module)
 
     for class_name in module.classes:
-        full_name = f"{module.name}.{class_name}"
-        cls = hydra.utils.get_class(full_name)
-        params: List[Parameter] = []
-        params += default_flags
-        resolved_hints = get_type_hints(cls.__init__)
-        sig = inspect.signature(cls.__init__)
-
-        for name, p in sig.parameters.items():
-            # Skip self/args as attributes
-            if name == "self" or (
-                p.kind
-                in (inspect._ParameterKind.VAR_POSITIONAL, inspect._ParameterKind.VAR_KEYWORD)
-            ):
-                continue
-            type_ = type_cached = resolved_hints.get(name, p.annotation)
-            default_ = p.default
-
-            missing_value = default_ == sig.empty
-            incompatible_value_type = not missing_value and is_incompatible(type(default_))
-            missing_annotation_type = name not in resolved_hints
-            incompatible_annotation_type = not missing_annotation_type and is_incompatible(type_)
-
-            if isinstance(default_, Enum):
-                module_name = getattr(default_, "__module__", None)
-                if module_name is not None:  # Import required
-                    import_name = default_.__class__.__name__
-                    string_imports.add(f"from {module_name} import {import_name}")
-
-            if missing_annotation_type or incompatible_annotation_type:
-                type_ = Any
-                collect_imports(imports, Any)  # type: ignore
-
-            if not missing_value:
-                if type_ == str or type(default_) == str:  # noqa
-                    default_ = f'"{default_}"'
-                elif isinstance(default_, list):
-                    default_ = f"field(default_factory=lambda: {default_})"
-                elif isinstance(default_, dict):
-                    default_ = f"field(default_factory=lambda: {default_})"
-
-            missing_default = True if incompatible_value_type else missing_value
-            collect_imports(imports, type_)  # type: ignore
-
-            if missing_default:
-                default_ = "MISSING"
-                string_imports.add("from omegaconf import MISSING")
-
-            if isinstance(default_, Enum):
-                default_ = Enum.__str__(default_)
-
-            if incompatible_annotation_type:
-                default_ = f"{default_}  # {type_str(type_cached)}"
-            elif incompatible_value_type:
-                default_ = f"{default_}  # {type_str(type(p.default))}"  # if not missing_value:
-
-            params.append(
-                Parameter(
-                    name=name,
-                    type_str=type_str(type_),
-                    default=str(default_),
-                )
-            )
-        classes_map[class_name] = ClassInfo(
-            target=full_name,
-            module=module.name,
-            name=class_name,
-            parameters=params,
+        classes_map[class_name] = _build_class_info(
+            module.name, class_name, default_flags, imports, string_imports
         )
 
-    template = jinja_env.get_template("module.j2")
-    rendered = template.render(
+    rendered = _MODULE_TEMPLATE.render(
         imports=convert_imports(imports, string_imports),
         classes=module.classes,
         classes_map=classes_map,
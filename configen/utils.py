@@ -1,10 +1,11 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
-import sys
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from types import UnionType
 from typing import (
     Any,
+    FrozenSet,
     List,
     Literal,
     Optional,
@@ -26,6 +27,11 @@ PrimitiveType: TypeAlias = Union[
 ]
 
 
+@lru_cache(maxsize=4096)
+def resolve_optional(type_: Any) -> Tuple[bool, Any]:
+    return _resolve_optional(type_)
+
+
 def _resolve_literal(
     type_: type,
 ) -> Union[PrimitiveType, Type[PrimitiveType]]:
@@ -39,8 +45,9 @@ def _resolve_literal(
 
 
 # borrowed from OmegaConf
+@lru_cache(maxsize=4096)
 def type_str(type_: Any) -> str:
-    is_optional, type_ = _resolve_optional(type_)
+    is_optional, type_ = resolve_optional(type_)
     if type_ is None:
         return type(type_).__name__
     if type_ is Any:
@@ -48,7 +55,7 @@ def type_str(type_: Any) -> str:
     if type_ is ...:
         return "..."
 
-    if is_literal_type(type_) or get_origin(type_) is Literal:
+    if is_literal_annotation(type_):
         type_ = _resolve_literal(type_)
 
     if hasattr(type_, "__name__"):
@@ -77,12 +84,22 @@ def type_str(type_: Any) -> str:
         return ret
 
 
+def is_literal_annotation(type_: Any) -> bool:
+    return is_literal_type(type_) or get_origin(type_) is Literal
+
+
 def is_tuple_annotation(type_: Any) -> bool:
-    origin = getattr(type_, "__origin__", None)
-    if sys.version_info < (3, 7, 0):
-        return origin is Tuple or type_ is Tuple  # pragma: no cover
-    else:
-        return origin is tuple  # pragma: no cover
+    return getattr(type_, "__origin__", None) is tuple
+
+
+# Names to import special typing forms and (the typing aliases of) generic builtins under.
+_TYPING_NAMES = {Any: "Any", Optional: "Optional", Union: "Union"}
+_ORIGIN_NAMES = {list: "List", tuple: "Tuple", dict: "Dict"}
+
+
+@lru_cache(maxsize=512)
+def _import_line(module: str, name: str) -> str:
+    return f"from {module} import {name}"
 
 
 def convert_imports(imports: Set[Type], string_imports: Set[str]) -> List[str]:
@@ -91,47 +108,47 @@ def convert_imports(imports: Set[Type], string_imports: Set[str]) -> List[str]:
         if isinstance(import_, UnionType):
             tmp.add("from typing import Union")
             continue
-        elif import_ is Any:
-            classname = "Any"
-        elif import_ is Optional:  # type: ignore
-            classname = "Optional"
-        elif import_ is Union:  # type: ignore
-            classname = "Union"
-        else:
-            origin = getattr(import_, "__origin__", None)
-            if origin is list:
-                classname = "List"
-            elif origin is tuple:
-                classname = "Tuple"
-            elif origin is dict:
-                classname = "Dict"
-            else:
-                classname = import_.__name__
-        if (
-            not is_primitive_type_annotation(import_)
-            or issubclass(import_, Enum)  # type: ignore
-            or (import_ is Path)
+        module = import_.__module__
+        # Builtins and primitives (bar Enums and Path) need no import: skip them before resolving
+        # the name to import.
+        if module == "builtins" or (
+            is_primitive_type_annotation(import_)
+            and not issubclass(import_, Enum)  # type: ignore
+            and import_ is not Path
         ):
-            if import_.__module__ != "builtins":
-                tmp.add(f"from {import_.__module__} import {classname}")
-
-    return sorted(list(tmp.union(string_imports)))
+            continue
+        classname = (
+            _TYPING_NAMES.get(import_)
+            or _ORIGIN_NAMES.get(getattr(import_, "__origin__", None))
+            or import_.__name__
+        )
+        tmp.add(_import_line(module, classname))
+
+    tmp |= string_imports
+    return sorted(tmp)
+
+
+@lru_cache(maxsize=4096)
+def _imports_for(type_: Type) -> FrozenSet[Type]:
+    imports: Set[Type] = set()
+    stack: List[Type] = [type_]
+    while stack:
+        current = stack.pop()
+        # Literal values are not types, necessitating this special-casing, inelegant as it is.
+        if is_literal_annotation(current):
+            continue
+        stack.extend(arg for arg in get_args(current) if arg is not ...)
+        is_opt, inner_type = resolve_optional(current)
+        if is_opt and current is not Any:
+            imports.add(Optional)
+            if is_union_type(inner_type):
+                imports.add(Union)
+        elif is_union_type(current):
+            imports.add(Union)
+        else:
+            imports.add(current)
+    return frozenset(imports)
 
 
 def collect_imports(imports: Set[Type], type_: Type) -> None:
-    # Literal values are not types, necessitating this special-casing, inelegant as it is.
-    if not is_literal_type(type_) and get_origin(type_) is not Literal:
-        for arg in get_args(type_):
-            if arg is not ...:
-                collect_imports(imports, arg)
-        imports_ = set()
-        is_opt, inner_type = _resolve_optional(type_)
-        if is_opt and type_ is not Any:
-            imports_.add(Optional)
-            if is_union_type(inner_type):
-                imports_.add(Union)
-        elif is_union_type(type_):
-            imports_.add(Union)
-        else:
-            imports_.add(type_)
-        imports.update(imports_)
+    imports |= _imports_for(type_)
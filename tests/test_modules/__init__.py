@@ -1,4 +1,6 @@
 # Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+import operator
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -8,6 +10,8 @@ from typing_extensions import TypeAlias
 
 from omegaconf import MISSING, DictConfig
 
+_BOND = sys.intern("Bond, James Bond")
+
 
 class Color(Enum):
     RED = 0
@@ -15,79 +19,133 @@ class Color(Enum):
     BLUE = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     name: str = MISSING
     age: int = MISSING
 
 
-class LibraryClass:
+def _with_fast_eq(cls):
+    """
+    Give a slotted class an __eq__ comparing the values of all of its slots
+    """
+    values = operator.attrgetter(*cls.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return values(self) == values(other)
+
+    cls.__eq__ = __eq__
+    cls.__hash__ = None
+    return cls
+
+
+class _Singleton:
+    """
+    Base for classes whose instances are all equal: every call returns the same instance, so the
+    default identity-based __eq__ suffices
+    """
+
+    __slots__ = ()
+
+    def __new__(cls):
+        # Look in the class's own namespace so that subclasses don't share their parent's instance.
+        if "_instance" not in cls.__dict__:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+
+class LibraryClass(_Singleton):
     """
     Some class from a user library that is incompatible with OmegaConf config
     """
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
-    def __eq__(self, other):
-        return isinstance(other, type(self))
 
+class Empty(_Singleton):
+    __slots__ = ()
 
-class Empty:
     def __init__(self):
         ...
 
-    def __eq__(self, other):
-        return isinstance(other, type(self))
-
 
+@_with_fast_eq
 class UntypedArg:
+    __slots__ = ("param",)
+
     def __init__(self, param):
         self.param = param
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and other.param == self.param
-
 
+@_with_fast_eq
 class IntArg:
+    __slots__ = ("param",)
+    __match_args__ = __slots__
+
     def __init__(self, param: int):
         self.param = param
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and other.param == self.param
-
 
+@_with_fast_eq
 class PathArg:
+    __slots__ = ("param",)
+    __match_args__ = __slots__
+
     def __init__(self, param: Path):
         self.param = param
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and other.param == self.param
-
 
+@_with_fast_eq
 class Args:
+    __slots__ = ("param",)
+
     def __init__(self, *args: Any):
         self.param = args
 
 
+@_with_fast_eq
 class Kwargs:
+    __slots__ = ("param",)
+
     def __init__(self, **kwargs: Any):
         self.param = kwargs
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and other.param == self.param
+
+_DEF_PARAM5 = ("foo", "bar")
+_U_INT_FLOAT: TypeAlias = Union[int, float]
+_U_STR_PATH: TypeAlias = Union[str, Path]
+_U_STR_DC: TypeAlias = Union[str, DictConfig]
+_U_STR_SEQ: TypeAlias = Union[str, List[str], Tuple[str, ...]]
+_U_STR_SEQ2: TypeAlias = Union[str, list[str], tuple[str, ...]]
 
 
+@_with_fast_eq
 class UnionArg:
+    __slots__ = (
+        "param",
+        "param2",
+        "param3",
+        "param4",
+        "param5",
+        "param6",
+        "param7",
+    )
+    __match_args__ = __slots__
+
     # Union is now supported by OmegaConf for primitive types.
     def __init__(
         self,
-        param: Union[int, float],
+        param: _U_INT_FLOAT,
         param2: Optional[Union[str, Color, bool]] = None,
-        param3: Union[str, Path] = "",
-        param4: Union[str, DictConfig] = "",
-        param5: Union[str, List[str], Tuple[str, ...]] = ("foo", "bar"),
-        param6: Union[str, list[str], tuple[str, ...]] = ("foo", "bar"),
+        param3: _U_STR_PATH = "",
+        param4: _U_STR_DC = "",
+        param5: _U_STR_SEQ = _DEF_PARAM5,
+        param6: _U_STR_SEQ2 = _DEF_PARAM5,
         param7: str | Path = "",
     ):
         self.param = param
@@ -98,81 +156,77 @@ class UnionArg:
         self.param6 = param6
         self.param7 = param7
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and other.param == self.param
-            and other.param2 == self.param2
-            and other.param3 == self.param3
-            and other.param4 == self.param4
-            and other.param5 == self.param5
-            and other.param6 == self.param6
-            and other.param7 == self.param7
-        )
-
 
+@_with_fast_eq
 class WithLibraryClassArg:
+    __slots__ = ("num", "param")
+    __match_args__ = __slots__
+
     def __init__(self, num: int, param: LibraryClass):
         self.num = num
         self.param = param
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and other.num == self.num and other.param == self.param
-
 
-@dataclass
+@dataclass(slots=True)
 class IncompatibleDataclass:
     library: LibraryClass = field(default_factory=LibraryClass)
 
     def __eq__(self, other):
-        return isinstance(other, type(self)) and other.library == self.library
+        if type(other) is not type(self):
+            return NotImplemented
+        return other.library == self.library
 
 
+@_with_fast_eq
 class IncompatibleDataclassArg:
+    __slots__ = ("num", "incompat")
+    __match_args__ = __slots__
+
     def __init__(self, num: int, incompat: IncompatibleDataclass):
         self.num = num
         self.incompat = incompat
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.num == other.num
-            and self.incompat == other.incompat
-        )
-
 
+@_with_fast_eq
 class WithStringDefault:
+    __slots__ = ("no_default", "default_str", "none_str")
+    __match_args__ = __slots__
+
     def __init__(
         self,
         no_default: str,
-        default_str: str = "Bond, James Bond",
+        default_str: str = _BOND,
         none_str: Optional[str] = None,
     ):
         self.no_default = no_default
         self.default_str = default_str
         self.none_str = none_str
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.no_default == other.no_default
-            and self.default_str == other.default_str
-            and self.none_str == other.none_str
-        )
-
 
+@_with_fast_eq
 class WithUntypedStringDefault:
+    __slots__ = ("default_str",)
+
     def __init__(
         self,
-        default_str="Bond, James Bond",
+        default_str=_BOND,
     ):
         self.default_str = default_str
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and self.default_str == other.default_str
-
 
+@_with_fast_eq
 class ListValues:
+    __slots__ = (
+        "lst",
+        "lst2",
+        "enum_lst",
+        "passthrough_list",
+        "dataclass_val",
+        "def_value",
+        "def_value2",
+    )
+    __match_args__ = __slots__
+
     def __init__(
         self,
         lst: List[str],
@@ -191,20 +245,20 @@ class ListValues:
         self.def_value = def_value
         self.def_value2 = def_value2
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.lst == other.lst
-            and self.lst2 == other.lst2
-            and self.enum_lst == other.enum_lst
-            and self.passthrough_list == other.passthrough_list
-            and self.dataclass_val == other.dataclass_val
-            and self.def_value == other.def_value
-            and self.def_value2 == other.def_value2
-        )
-
 
+@_with_fast_eq
 class DictValues:
+    __slots__ = (
+        "dct",
+        "dct2",
+        "enum_key",
+        "dataclass_val",
+        "passthrough_dict",
+        "def_value",
+        "def_value2",
+    )
+    __match_args__ = __slots__
+
     def __init__(
         self,
         dct: Dict[str, str],
@@ -223,20 +277,10 @@ class DictValues:
         self.def_value = def_value
         self.def_value2 = def_value2
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.dct == other.dct
-            and self.dct2 == other.dct2
-            and self.enum_key == other.enum_key
-            and self.dataclass_val == other.dataclass_val
-            and self.passthrough_dict == other.passthrough_dict
-            and self.def_value == other.def_value
-            and self.def_value2 == other.def_value2
-        )
-
-
-class PeskySentinel(object):
+
+class PeskySentinel(_Singleton):
+    __slots__ = ()
+
     def __repr__(self):
         return "<I am a pesky sentinel>"
 
@@ -244,51 +288,70 @@ class PeskySentinel(object):
 pesky = PeskySentinel()
 
 
+@_with_fast_eq
 class PeskySentinelUsage:
+    __slots__ = ("foo",)
+
     def __init__(self, foo=pesky):
         self.foo = foo
 
-    def __eq__(self, other):
-        return isinstance(other, type(self)) and self.foo == other.foo
 
+_DEF_T3 = (1, 2, 3)
+_DEF_T4 = (0.1, 0.2, 0.3)
 
+
+@_with_fast_eq
 class Tuples:
+    __slots__ = ("t1", "t2", "t3", "t4")
+    __match_args__ = __slots__
+
     def __init__(
         self,
         t1: Tuple[float, float],
         t2: tuple[float, float],
-        t3=(1, 2, 3),
-        t4: Tuple[float, ...] = (0.1, 0.2, 0.3),
+        t3=_DEF_T3,
+        t4: Tuple[float, ...] = _DEF_T4,
     ):
         self.t1 = t1
         self.t2 = t2
         self.t3 = t3
         self.t4 = t4
 
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.t1 == other.t1
-            and self.t2 == other.t2
-            and self.t3 == other.t3
-            and self.t4 == other.t4
-        )
-
 
 _LITERAL_WARN: TypeAlias = Literal["warn"]
+_LIT_ACTIVATION: TypeAlias = Literal["relu", "gelu"]
+_OPT_FAIRNESS: TypeAlias = Optional[Literal["DP", "EO"]]
+_BIT_DEPTH: TypeAlias = Optional[Union[Literal[5, 8], float]]
+_COLOR12: TypeAlias = Literal[Color.BLUE, Color.GREEN]
+_DETERM: TypeAlias = Optional[Union[bool, _LITERAL_WARN]]
+_MIXED_LIT: TypeAlias = Literal[0, "foo", "bar", Color.BLUE]
+_U_MIXED_LIT: TypeAlias = Union[Literal["foo", "bar", Color.BLUE], int]
 
 
+@_with_fast_eq
 class WithLiterals:
+    __slots__ = (
+        "activation",
+        "fairness",
+        "bit_depth",
+        "color1",
+        "color2",
+        "deterministic",
+        "mixed_type_lit",
+        "unioned_mixed_type_lit",
+    )
+    __match_args__ = __slots__
+
     def __init__(
         self,
-        activation: Literal["relu", "gelu"],
-        fairness: Optional[Literal["DP", "EO"]] = None,
-        bit_depth: Optional[Union[Literal[5, 8], float]] = 5,
-        color1: Literal[Color.BLUE, Color.GREEN] = Color.BLUE,
-        color2: Optional[Literal[Color.BLUE, Color.GREEN]] = Color.GREEN,
-        deterministic: Optional[Union[bool, _LITERAL_WARN]] = None,
-        mixed_type_lit: Literal[0, "foo", "bar", Color.BLUE] = 0,
-        unioned_mixed_type_lit: Union[Literal["foo", "bar", Color.BLUE], int] = 47,
+        activation: _LIT_ACTIVATION,
+        fairness: _OPT_FAIRNESS = None,
+        bit_depth: _BIT_DEPTH = 5,
+        color1: _COLOR12 = Color.BLUE,
+        color2: Optional[_COLOR12] = Color.GREEN,
+        deterministic: _DETERM = None,
+        mixed_type_lit: _MIXED_LIT = 0,
+        unioned_mixed_type_lit: _U_MIXED_LIT = 47,
     ):
         self.activation = activation
         self.fairness = fairness
@@ -298,16 +361,3 @@ class WithLiterals:
         self.deterministic = deterministic
         self.mixed_type_lit = mixed_type_lit
         self.unioned_mixed_type_lit = unioned_mixed_type_lit
-
-    def __eq__(self, other):
-        return (
-            isinstance(other, type(self))
-            and self.activation == other.activation
-            and self.fairness == other.fairness
-            and self.bit_depth == other.bit_depth
-            and self.color1 == other.color1
-            and self.color2 == other.color2
-            and self.deterministic == other.deterministic
-            and self.mixed_type_lit == other.mixed_type_lit
-            and self.unioned_mixed_type_lit == other.unioned_mixed_type_lit
-        )